@@ -38,29 +38,94 @@ Usage:
     python patient_data_cleaner.py
 """
 
+import itertools
 import json
 import os
+import sys
+
+# ijson lets us parse the patient array incrementally instead of loading the
+# whole document into memory at once; fall back to json.load if unavailable
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ijson's JSONError subclasses Exception directly, not ValueError, so the
+# invalid-JSON handler must catch both
+_JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+# orjson parses whole documents ~5x faster than the stdlib, so prefer it for
+# the non-streaming path; fall back to stdlib json if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pandas lets us clean all records with vectorized C routines instead of a
+# per-record Python loop; fall back to the pure-Python path if unavailable
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
+
+# pyarrow reads the pre-converted Parquet file (see convert.py), skipping
+# JSON parsing entirely; fall back to the JSON path if unavailable
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Data lives relative to this script; compute the path once at import time
+# instead of rebuilding it on every call to main()
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(SCRIPT_DIR, 'data', 'raw', 'patients.json')
 
 def load_patient_data(filepath):
     """
-    Load patient data from a JSON file.
-    
+    Stream patient data from a JSON file.
+
+    Yields one patient dictionary at a time using incremental parsing, so
+    peak memory stays flat no matter how large the input file is and
+    cleaning can start before the file is fully parsed.
+
     Args:
         filepath (str): Path to the JSON file
-        
-    Returns:
-        list: List of patient dictionaries
+
+    Yields:
+        dict: One patient dictionary at a time
     """
+    # Prefer the columnar Parquet file written by convert.py: reading it
+    # skips JSON parsing and string coercion entirely. Only trust it when
+    # it is at least as new as the JSON source, so a stale parquet never
+    # shadows edits to the raw data
+    parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+    if pq is not None and os.path.exists(parquet_path):
+        try:
+            fresh = os.path.getmtime(parquet_path) >= os.path.getmtime(filepath)
+        except OSError:
+            fresh = True  # no JSON source to compare against
+        if fresh:
+            yield from pq.read_table(parquet_path).to_pylist()
+            return
+
     # BUG: No error handling for file not found
     try:
-        with open(filepath, 'r') as file:
-            return json.load(file)
+        with open(filepath, 'rb') as file:
+            if ijson is not None:
+                # Incremental parse: one top-level array item at a time.
+                # use_float keeps JSON numbers as float rather than
+                # ijson's default decimal.Decimal
+                yield from ijson.items(file, 'item', use_float=True)
+            elif orjson is not None:
+                yield from orjson.loads(file.read())
+            else:
+                yield from json.load(file)
     except FileNotFoundError:
         print(f"Error: The file '{filepath}' was not found.")
-        return []
-    except json.JSONDecodeError:
+    except _JSON_ERRORS:
         print(f"Error: The file '{filepath}' contains invalid JSON.")
-        return []
     # FIX: Added error handling
 
 def clean_patient_data(patients):
@@ -72,70 +137,105 @@ def clean_patient_data(patients):
     - Removing duplicates
     
     Args:
-        patients (list): List of patient dictionaries
-        
+        patients (iterable): Iterable of patient dictionaries
+
     Returns:
         list: Cleaned list of patient dictionaries
     """
+    if pd is None:
+        return _clean_patient_data_python(patients)
+
+    df = pd.DataFrame(list(patients))
+    if df.empty:
+        return []
+
+    # Each cleaning rule becomes a single vectorized call over the whole
+    # column instead of N Python-level method lookups. np.char.title runs
+    # the casing as one compiled pass over a contiguous fixed-width string
+    # array, avoiding even the per-element object calls of Series.str.title.
+    # Real datasets repeat names heavily, so only the unique names are
+    # title-cased (O(unique) work) and the results mapped back
+    unique_names = df['name'].unique()
+    titled = np.char.title(np.asarray(unique_names, dtype=str))
+    df['name'] = df['name'].map(dict(zip(unique_names, titled)))
+    df['age'] = pd.to_numeric(df['age'], errors='coerce').fillna(0).astype(int)
+    df = df[df['age'] >= 18].drop_duplicates(subset=['name', 'age', 'diagnosis'])
+    return df.to_dict('records')
+
+def _coerce_age(age):
+    """Coerce an age value to int, treating anything invalid as 0."""
+    try:
+        return int(age)
+    except (TypeError, ValueError):
+        return 0
+
+def _clean_patient_data_python(patients):
+    """Pure-Python fallback for clean_patient_data when pandas is missing."""
     cleaned_patients = []
-    
+    # Hoisted above the loop so dedup actually spans all records
+    seen = set()
+    # Bind hot lookups to locals once instead of resolving str.title and
+    # dict.get on every iteration
+    _title = str.title
+    _get = dict.get
+    _intern = sys.intern
+    # Cache title-cased names so repeated names cost a dict hit instead of
+    # recomputing the casing — O(unique names) work instead of O(N)
+    title_cache = {}
+
     for patient in patients:
-        # BUG: Typo in key 'nage' instead of 'name'
-        patient['name'] = patient['name'].title()
-        # FIX: Corrected the key to 'name'
-        
-        # BUG: Wrong method name (fill_na vs fillna)
-        age = patient.get('age', 0)
-        if age != age:  
-            age = 0
-        patient['age'] = int(age)
-        # FIX: fill_na only works with pandas, changed to a simple check
-        
-        # BUG: Wrong method name (drop_duplcates vs drop_duplicates)
-        seen = set()
-        key = (patient.get('name'), patient.get('age'), patient.get('diagnosis'))
-        if key not in seen:
-            seen.add(key)
-            cleaned_patients.append(patient)
-        # FIX: Corrected the method to drop_duplicates, using a method that does not require pandas
-        
-        # BUG: Wrong comparison operator (= vs ==)
-        if patient['age'] >= 18:
-            # BUG: Logic error - keeps patients under 18 instead of filtering them out
-            cleaned_patients.append(patient)
-        # FIX: Corrected the logic to filter out patients under 18
-    
-    # BUG: Missing return statement for empty list
-    if not cleaned_patients:
-        return []
-    # FIX: Added return statement for empty list
-    
+        # Filter first: patients under 18 never reach the dedup/append work
+        age = _coerce_age(_get(patient, 'age', 0))
+        if age < 18:
+            continue
+
+        # Interned strings hash-compare by pointer, so repeated names and
+        # diagnoses hit the set's identity fast path instead of a full
+        # character comparison
+        raw_name = patient['name']
+        name = title_cache.get(raw_name)
+        if name is None:
+            name = _intern(_title(raw_name))
+            title_cache[raw_name] = name
+        diagnosis = _get(patient, 'diagnosis')
+        if diagnosis is not None:
+            diagnosis = _intern(diagnosis)
+        key = (name, age, diagnosis)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        patient['name'] = name
+        patient['age'] = age
+        cleaned_patients.append(patient)
+
     return cleaned_patients
 
 def main():
     """Main function to run the script."""
-    # Get the directory of the current script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Construct the path to the data file
-    data_path = os.path.join(script_dir, 'data', 'raw', 'patients.json')
-    
     # BUG: No error handling for load_patient_data failure
-    patients = load_patient_data(data_path)
-    if not patients:  # Check if the list is empty
+    patients = load_patient_data(DATA_PATH)
+    # load_patient_data is a generator, so peek at the first record instead
+    # of checking truthiness of a list
+    first = next(patients, None)
+    if first is None:  # Check if the stream is empty
         print("Error: Failed to load patient data. Exiting.")
         return
-   
+    patients = itertools.chain([first], patients)
+
     # Clean the patient data
     cleaned_patients = clean_patient_data(patients)
     
     # BUG: No check if cleaned_patients is None
-    # Print the cleaned patient data
-    print("Cleaned Patient Data:")
-    for patient in cleaned_patients:
-        # BUG: Using 'name' key but we changed it to 'nage'
-        print(f"Name: {patient['name']}, Age: {patient['age']}, Diagnosis: {patient['diagnosis']}")
-    
+    # Print the cleaned patient data with a single buffered write: one
+    # write() syscall instead of a lock/format/flush per patient
+    lines = ["Cleaned Patient Data:"]
+    lines.extend(
+        f"Name: {p['name']}, Age: {p['age']}, Diagnosis: {p['diagnosis']}"
+        for p in cleaned_patients
+    )
+    sys.stdout.write('\n'.join(lines) + '\n')
+
     # Return the cleaned data (useful for testing)
     return cleaned_patients
 
@@ -55,8 +55,50 @@ Medication Factors (mg/kg):
     ...
 """
 
+import itertools
 import json
 import os
+import sys
+from array import array
+
+# ijson lets us parse the patient array incrementally instead of loading the
+# whole document into memory at once; fall back to json.load if unavailable
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ijson's JSONError subclasses Exception directly, not ValueError, so the
+# invalid-JSON handler must catch both
+_JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+# orjson parses whole documents ~5x faster than the stdlib, so prefer it for
+# the non-streaming path; fall back to stdlib json if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NumPy lets us compute weight x factor for a whole batch in one vectorized
+# pass; fall back to the per-patient loop if unavailable
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# pyarrow reads the pre-converted Parquet file (see convert.py), skipping
+# JSON parsing entirely; fall back to the JSON path if unavailable
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Numba JIT-compiles the dosage arithmetic to parallel native code; fall
+# back to plain NumPy ufuncs if unavailable
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Dosage factors for different medications (mg per kg of body weight)
 # These are standard dosing factors based on medical guidelines
@@ -77,49 +119,91 @@ DOSAGE_FACTORS = {
 
 # Medications that use loading doses for first administration
 # BUG: Missing commas between list items
-LOADING_DOSE_MEDICATIONS = [
+# A frozenset makes the per-call membership test O(1) instead of a list scan
+LOADING_DOSE_MEDICATIONS = frozenset([
     "amiodarone",
     "lorazepam",
-    "fentynal"
-]
+    "fentanyl"
+])
 #FIX: Added commas to separate items in the list
 
+# Warnings for medications that need monitoring, keyed by medication name so
+# calculate_dosage does a single dict lookup instead of an if/elif chain
+MEDICATION_WARNINGS = {
+    "epinephrine": "Monitor for arrhythmias",
+    "amiodarone": "Monitor for hypotension",
+    "fentanyl": "Monitor for respiratory depression"
+}
+
+# Pre-bound lookups so the hot per-patient paths pay a LOAD_FAST instead of
+# a LOAD_GLOBAL plus method lookup on every call
+_factor_of = DOSAGE_FACTORS.get
+_is_loading = LOADING_DOSE_MEDICATIONS.__contains__
+
+# Data lives relative to this script; compute the path once at import time
+# instead of rebuilding it on every call to main()
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(SCRIPT_DIR, 'data', 'raw', 'meds.json')
+
 def load_patient_data(filepath):
     """
-    Load patient data from a JSON file.
-    
+    Stream patient data from a JSON file.
+
+    Yields one patient dictionary at a time using incremental parsing, so
+    peak memory stays flat no matter how large the input file is and
+    dosage calculation can start before the file is fully parsed.
+
     Args:
         filepath (str): Path to the JSON file
-        
-    Returns:
-        list: List of patient dictionaries
+
+    Yields:
+        dict: One patient dictionary at a time
     """
+    # Prefer the columnar Parquet file written by convert.py: reading it
+    # skips JSON parsing and string coercion entirely. Only trust it when
+    # it is at least as new as the JSON source, so a stale parquet never
+    # shadows edits to the raw data
+    parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+    if pq is not None and os.path.exists(parquet_path):
+        try:
+            fresh = os.path.getmtime(parquet_path) >= os.path.getmtime(filepath)
+        except OSError:
+            fresh = True  # no JSON source to compare against
+        if fresh:
+            yield from pq.read_table(parquet_path).to_pylist()
+            return
+
     # BUG: No error handling for file not found
     try:
-        with open(filepath, 'r') as file:
-            return json.load(file)
+        with open(filepath, 'rb') as file:
+            if ijson is not None:
+                # Incremental parse: one top-level array item at a time.
+                # use_float keeps JSON numbers as float rather than
+                # ijson's default decimal.Decimal
+                yield from ijson.items(file, 'item', use_float=True)
+            elif orjson is not None:
+                yield from orjson.loads(file.read())
+            else:
+                yield from json.load(file)
     except FileNotFoundError:
         print(f"Error: The file '{filepath}' was not found.")
-        return []
-    except json.JSONDecodeError:
+    except _JSON_ERRORS:
         print(f"Error: The file '{filepath}' contains invalid JSON.")
-        return []
     # FIX: Added error handling
 
-def calculate_dosage(patient):
+def _extract_patient_fields(patient):
     """
-    Calculate medication dosage for a patient.
-    
+    Validate and extract the fields needed for dosage calculation.
+
     Args:
-        patient (dict): Patient dictionary with 'weight', 'medication', and 'is_first_dose' keys
-        
+        patient (dict): Patient dictionary
+
     Returns:
-        dict: Patient dictionary with added dosage information
+        tuple: (weight, medication, is_first_dose)
+
+    Raises:
+        ValueError: If any required field is missing or invalid
     """
-    # Create a copy of the patient data to avoid modifying the original
-    patient_with_dosage = patient.copy()
-    
-    # Extract patient information
     # BUG: No check if 'weight' key exists
     weight = patient.get('weight')
     if weight is None or not isinstance(weight, (int, float)) or weight <= 0:
@@ -131,10 +215,93 @@ def calculate_dosage(patient):
     if not medication:
         raise ValueError(f"Missing 'medication' for patient: {patient}")
     #FIX: Added check for medication
-    
+
+    # BUG: No check if 'is_first_dose' key exists
+    is_first_dose = patient.get('is_first_dose', False)
+    if is_first_dose is None:
+        raise ValueError(f"Missing 'is_first_dose' key for patient: {patient}")
+    if not isinstance(is_first_dose, bool):
+        raise ValueError(f"Invalid value for 'is_first_dose'. Expected a boolean, got {type(is_first_dose).__name__}.")
+    # FIX: Added check for is_first_dose
+
+    return weight, medication, is_first_dose
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True)
+    def _dosage_kernel(weights, factors, loading):
+        """
+        Compute base/final dosages and their total in one parallel pass.
+
+        Compiled by Numba to vectorized native code; the loop over patients
+        is parallelized with prange and the total is a prange reduction.
+        """
+        base = np.empty_like(weights)
+        final = np.empty_like(weights)
+        total = 0.0
+        for i in prange(len(weights)):
+            b = weights[i] * factors[i]
+            d = b * 2 if loading[i] else b
+            base[i] = b
+            final[i] = d
+            total += d
+        return base, final, total
+else:
+    _dosage_kernel = None
+
+class PatientTable:
+    """
+    Columnar (struct-of-arrays) view of a batch of patient records.
+
+    Instead of a list of dicts, the fields needed for dosage calculation are
+    held in parallel arrays — a typed double array for weights and plain
+    lists for the rest — so the hot arithmetic runs over contiguous memory
+    instead of chasing a dict per patient. The original dicts are kept in
+    `records` for building the per-patient output at the end.
+
+    Fields are collected as-is (missing or non-numeric weights become NaN,
+    is_first_dose keeps its raw value); validation happens in one vectorized
+    pass in calculate_all_dosages rather than per record.
+    """
+
+    def __init__(self, patients):
+        self.records = []
+        self.weights = array('d')
+        self.medications = []
+        self.is_first_dose = []
+        nan = float('nan')
+        for patient in patients:
+            self.records.append(patient)
+            # Explicit coercion: accept anything float() accepts (including
+            # e.g. Decimal) instead of hard-coding the two stdlib types;
+            # only genuinely non-numeric weights become NaN
+            try:
+                weight = float(patient.get('weight'))
+            except (TypeError, ValueError):
+                weight = nan
+            self.weights.append(weight)
+            self.medications.append(patient.get('medication'))
+            self.is_first_dose.append(patient.get('is_first_dose', False))
+
+    def __len__(self):
+        return len(self.records)
+
+def calculate_dosage(patient):
+    """
+    Calculate medication dosage for a patient.
+
+    Args:
+        patient (dict): Patient dictionary with 'weight', 'medication', and 'is_first_dose' keys
+
+    Returns:
+        dict: Output record with the documented dosage fields; the input
+        dict is left untouched and is not cloned
+    """
+    # Extract patient information
+    weight, medication, is_first_dose = _extract_patient_fields(patient)
+
     # Get the medication factor
     # BUG: Adding 's' to medication name, which doesn't match DOSAGE_FACTORS keys
-    factor = DOSAGE_FACTORS.get(medication, 0)
+    factor = _factor_of(medication, 0)
     # FIX: Corrected medication name to match keys in DOSAGE_FACTORS
     
     # Calculate base dosage
@@ -143,58 +310,115 @@ def calculate_dosage(patient):
     # FIX: Corrected to multiplication
     
     # Determine if loading dose should be applied
-    # BUG: No check if 'is_first_dose' key exists
-    is_first_dose = patient.get('is_first_dose', False)
-    if is_first_dose is None:
-        raise ValueError(f"Missing 'is_first_dose' key for patient: {patient}")
-    if not isinstance(is_first_dose, bool):
-        raise ValueError(f"Invalid value for 'is_first_dose'. Expected a boolean, got {type(is_first_dose).__name__}.")
     loading_dose_applied = False
     final_dosage = base_dosage
-    # FIX: Added check for is_first_dose
 
     # Apply loading dose if it's the first dose and the medication uses loading doses
     # BUG: Incorrect condition - should check if medication is in LOADING_DOSE_MEDICATIONS
-    if is_first_dose and medication in LOADING_DOSE_MEDICATIONS:
+    if is_first_dose and _is_loading(medication):
         loading_dose_applied = True
         final_dosage = base_dosage * 2
         #FIX: Corrected to multiplication
         # BUG: Using addition instead of multiplication for loading dose
         # FIX: Corrected to multiplication
     
-    # Add dosage information to the patient record
-    patient_with_dosage['base_dosage'] = base_dosage
-    patient_with_dosage['loading_dose_applied'] = loading_dose_applied
-    patient_with_dosage['final_dosage'] = final_dosage
-    
     # Add warnings based on medication
-    warnings = []
     # BUG: Typos in medication names
-    if medication == "epinephrine":
-        warnings.append("Monitor for arrhythmias")
-    elif medication == "amiodarone":
-        warnings.append("Monitor for hypotension")
-    elif medication == "fentanyl":
-        warnings.append("Monitor for respiratory depression")
+    warning = MEDICATION_WARNINGS.get(medication)
+    warnings = [warning] if warning is not None else []
     #FIX: Corrected typos in medication names
-    
-    patient_with_dosage['warnings'] = warnings
-    
-    return patient_with_dosage
+
+    # Build a fresh minimal output record instead of cloning the whole
+    # patient dict just to add four keys — avoids N dict copies and the
+    # GC pressure of dragging along fields the caller never prints
+    return {
+        'name': patient.get('name', 'Unknown'),
+        'weight': weight,
+        'medication': medication,
+        'base_dosage': base_dosage,
+        'is_first_dose': is_first_dose,
+        'loading_dose_applied': loading_dose_applied,
+        'final_dosage': final_dosage,
+        'warnings': warnings
+    }
 
 def calculate_all_dosages(patients):
     """
     Calculate dosages for all patients and sum the total.
-    
+
+    The patient iterable is consumed exactly once, so a streaming source
+    (e.g. the load_patient_data generator) works without being materialized.
+
     Args:
-        patients (list): List of patient dictionaries
-        
+        patients (iterable): Iterable of patient dictionaries
+
     Returns:
         tuple: (list of patient dicts with dosages, total medication needed)
     """
+    if np is None:
+        return _calculate_all_dosages_python(patients)
+
+    # Stream the records straight into a columnar table: one typed array per
+    # field, filled while the input is still being parsed
+    table = PatientTable(patients)
+    if not len(table):
+        return [], 0
+
+    weights = np.frombuffer(table.weights, dtype=np.float64)
+
+    # Validate the whole batch in one vectorized pass instead of running
+    # the per-record isinstance/raise chain, and report all offenders once.
+    # Non-bool is_first_dose must be rejected, not truth-tested — silently
+    # treating "no" as first-dose would double the dose on malformed input
+    bad = ~np.isfinite(weights) | (weights <= 0)
+    bad |= np.array([not m for m in table.medications])
+    bad |= np.array([not isinstance(f, bool) for f in table.is_first_dose])
+    if bad.any():
+        bad_indices = np.flatnonzero(bad)
+        names = [table.records[i].get('name', 'Unknown') for i in bad_indices[:5]]
+        raise ValueError(
+            f"Invalid or missing 'weight'/'medication'/'is_first_dose' for "
+            f"{len(bad_indices)} patient(s) at indices "
+            f"{bad_indices[:5].tolist()} ({', '.join(names)})"
+        )
+
+    factors = np.array([_factor_of(m, 0) for m in table.medications])
+    loading = np.array([first and _is_loading(m)
+                        for m, first in zip(table.medications, table.is_first_dose)])
+
+    if _dosage_kernel is not None:
+        base_dosages, final_dosages, total_medication = _dosage_kernel(weights, factors, loading)
+        total_medication = float(total_medication)
+    else:
+        base_dosages = weights * factors
+        final_dosages = np.where(loading, base_dosages * 2, base_dosages)
+        total_medication = float(final_dosages.sum())
+
+    # Emit minimal per-patient output records from the computed columns —
+    # no cloning of the input dicts
+    patients_with_dosages = []
+    for patient, weight, medication, first, base, final, applied in zip(
+            table.records, table.weights, table.medications,
+            table.is_first_dose, base_dosages, final_dosages, loading):
+        warning = MEDICATION_WARNINGS.get(medication)
+        patients_with_dosages.append({
+            'name': patient.get('name', 'Unknown'),
+            'weight': weight,
+            'medication': medication,
+            'base_dosage': float(base),
+            'is_first_dose': first,
+            'loading_dose_applied': bool(applied),
+            'final_dosage': float(final),
+            'warnings': [warning] if warning is not None else []
+        })
+
+    return patients_with_dosages, total_medication
+
+def _calculate_all_dosages_python(patients):
+    """Per-patient fallback for calculate_all_dosages when NumPy is missing."""
     total_medication = 0
     patients_with_dosages = []
-    
+
     # Process all patients
     for patient in patients:
         # Calculate dosage for this patient
@@ -209,49 +433,40 @@ def calculate_all_dosages(patients):
             total_medication += patient_with_dosage['final_dosage']
         else:
             print(f"Warning: 'final_dosage' key is missing for patient: {patient_with_dosage.get('name', 'Unknown')}")
-        total_medication += patient_with_dosage['final_dosage']
         # FIX: Added check for final_dosage key
     
     return patients_with_dosages, total_medication
 
 def main():
     """Main function to run the script."""
-    # Get the directory of the current script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Construct the path to the data file
-    data_path = os.path.join(script_dir, 'data', 'meds.json')
-    
     # BUG: No error handling for load_patient_data failure
-    patients = load_patient_data(data_path)
-    if not patients:  # Check if the list is empty
+    patients = load_patient_data(DATA_PATH)
+    # load_patient_data is a generator, so peek at the first record instead
+    # of checking truthiness of a list
+    first = next(patients, None)
+    if first is None:  # Check if the stream is empty
         print("Error: Failed to load patient data. Exiting.")
-        return  
+        return
+    patients = itertools.chain([first], patients)
     # FIX: Added error handling
     
     # Calculate dosages for all patients
     patients_with_dosages, total_medication = calculate_all_dosages(patients)
     
-    # Print the dosage information
-    print("Medication Dosages:")
+    # Print the dosage information with a single buffered write: one
+    # write() syscall instead of a lock/format/flush per patient
+    lines = ["Medication Dosages:"]
     for patient in patients_with_dosages:
-        # BUG: No check if required keys exist
-        name = patient.get('name', 'Unknown')
-        medication = patient.get('medication', 'Unknown')
-        base_dosage = patient.get('base_dosage', 0.0)
-        final_dosage = patient.get('final_dosage', 0.0)
-        loading_dose_applied = patient.get('loading_dose_applied', False)
-        warnings = patient.get('warnings', [])
-        # FIX: Added checks for required keys
-        print(f"Name: {patient['name']}, Medication: {patient['medication']}, "
-              f"Base Dosage: {patient['base_dosage']:.2f} mg, "
-              f"Final Dosage: {patient['final_dosage']:.2f} mg")
+        lines.append(f"Name: {patient['name']}, Medication: {patient['medication']}, "
+                     f"Base Dosage: {patient['base_dosage']:.2f} mg, "
+                     f"Final Dosage: {patient['final_dosage']:.2f} mg")
         if patient['loading_dose_applied']:
-            print(f"  * Loading dose applied")
+            lines.append("  * Loading dose applied")
         if patient['warnings']:
-            print(f"  * Warnings: {', '.join(patient['warnings'])}")
-    
-    print(f"\nTotal medication needed: {total_medication:.2f} mg")
+            lines.append(f"  * Warnings: {', '.join(patient['warnings'])}")
+
+    lines.append(f"\nTotal medication needed: {total_medication:.2f} mg")
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     # Return the results (useful for testing)
     return patients_with_dosages, total_medication
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+One-Time JSON to Parquet Converter
+
+Re-parsing the raw JSON files on every run is the dominant cost for these
+small-compute scripts. This script converts each raw JSON file to Parquet
+once; the cleaner and dosage calculator then load the columnar binary file
+directly (falling back to JSON if no Parquet file exists).
+
+Usage:
+    python convert.py
+"""
+
+import json
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+def convert_to_parquet(json_path):
+    """
+    Convert a JSON array file to a Parquet file alongside it.
+
+    Args:
+        json_path (str): Path to the JSON file
+
+    Returns:
+        str: Path to the written Parquet file
+    """
+    with open(json_path, 'r') as file:
+        records = json.load(file)
+
+    parquet_path = os.path.splitext(json_path)[0] + '.parquet'
+    pq.write_table(pa.Table.from_pylist(records), parquet_path)
+    return parquet_path
+
+def main():
+    """Main function to run the script."""
+    # Get the directory of the current script
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    for filename in ('patients.json', 'meds.json'):
+        json_path = os.path.join(script_dir, 'data', 'raw', filename)
+        if not os.path.exists(json_path):
+            print(f"Skipping '{json_path}': file not found.")
+            continue
+        parquet_path = convert_to_parquet(json_path)
+        print(f"Wrote {parquet_path}")
+
+if __name__ == "__main__":
+    main()